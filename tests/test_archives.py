@@ -0,0 +1,100 @@
+import io
+import tarfile
+import zipfile
+
+import pytest
+
+Image = pytest.importorskip("PIL.Image")
+pytest.importorskip("numpy")
+pytest.importorskip("PyQt5.QtWidgets")
+
+from yomi_gui import PixelationThread, archive_member_name, iter_source_images
+
+
+def png_bytes(width=12, height=8):
+    buffer = io.BytesIO()
+    Image.new('RGB', (width, height), 'red').save(buffer, format='PNG')
+    return buffer.getvalue()
+
+
+def write_zip(path, members):
+    with zipfile.ZipFile(path, 'w') as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+
+
+def write_tar(path, members):
+    with tarfile.open(path, 'w:gz') as archive:
+        for name, data in members.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+
+
+def run_thread(image_paths, output_dir, resolutions):
+    thread = PixelationThread([str(path) for path in image_paths], str(output_dir), resolutions, None, 'png', 2)
+    results = []
+    progress = []
+    thread.finished.connect(results.extend)
+    thread.progress_updated.connect(progress.append)
+    thread.run()
+    return results, progress
+
+
+@pytest.mark.parametrize("name", ['../x.png', 'a/../../x.png', 'C:/x.png', 'C:x.png', '\\\\server\\x.png'])
+def test_archive_member_name_rejects_escaping_paths(name):
+    assert archive_member_name(name) is None
+
+
+def test_archive_member_name_normalizes_separators():
+    assert archive_member_name('/sprites\\hero.png') == 'sprites/hero.png'
+
+
+def test_archives_with_same_members_are_namespaced_and_deduplicated(tmp_path):
+    for folder in ('a', 'b'):
+        (tmp_path / folder).mkdir()
+        write_zip(tmp_path / folder / 'pack.zip', {'img.png': png_bytes(), 'img.jpg': png_bytes()})
+    (tmp_path / 'img.png').write_bytes(png_bytes())
+
+    paths = [str(tmp_path / 'a' / 'pack.zip'), str(tmp_path / 'b' / 'pack.zip'), str(tmp_path / 'img.png')]
+    names = [name for name, _, _ in iter_source_images(paths)]
+
+    assert names == ['pack/img.png', 'pack/img_2.jpg', 'pack/img_3.png', 'pack/img_4.jpg', 'img.png']
+
+
+@pytest.mark.parametrize("output_name", ['out.zip', 'out.tar.gz'])
+def test_archive_output_round_trip(tmp_path, output_name):
+    write_zip(tmp_path / 'sprites.zip', {'hero.png': png_bytes(), 'sub/enemy.png': png_bytes()})
+    write_tar(tmp_path / 'tiles.tar.gz', {'grass.png': png_bytes()})
+    output_path = tmp_path / output_name
+
+    results, progress = run_thread([tmp_path / 'sprites.zip', tmp_path / 'tiles.tar.gz'], output_path, [4])
+
+    if output_name.endswith('.zip'):
+        with zipfile.ZipFile(output_path) as archive:
+            members = archive.namelist()
+    else:
+        with tarfile.open(output_path) as archive:
+            members = archive.getnames()
+
+    expected = ['sprites/hero_pixelated_4x4.png', 'sprites/sub/enemy_pixelated_4x4.png', 'tiles/grass_pixelated_4x4.png']
+    assert sorted(members) == expected
+    assert sorted(results) == [f"{output_path}/{name}" for name in expected]
+    assert progress[-1] == 100
+
+
+def test_corrupt_member_is_skipped(tmp_path):
+    write_zip(tmp_path / 'sprites.zip', {'good.png': png_bytes(), 'bad.png': png_bytes(), 'good2.png': png_bytes()})
+    data = bytearray((tmp_path / 'sprites.zip').read_bytes())
+    data[data.index(b'bad.png') + len(b'bad.png') + 40] ^= 0xff
+    (tmp_path / 'sprites.zip').write_bytes(bytes(data))
+    (tmp_path / 'loose.png').write_bytes(png_bytes())
+
+    results, progress = run_thread([tmp_path / 'sprites.zip', tmp_path / 'loose.png'], tmp_path / 'out.zip', [4])
+
+    with zipfile.ZipFile(tmp_path / 'out.zip') as archive:
+        members = sorted(archive.namelist())
+
+    assert members == ['loose_pixelated_4x4.png', 'sprites/good2_pixelated_4x4.png', 'sprites/good_pixelated_4x4.png']
+    assert len(results) == 3
+    assert progress[-1] == 100
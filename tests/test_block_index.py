@@ -0,0 +1,25 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+Image = pytest.importorskip("PIL.Image")
+pytest.importorskip("PyQt5.QtWidgets")
+
+from yomi_gui import block_index
+
+
+@pytest.mark.parametrize("width, height, res", [
+    (100, 70, 64),
+    (360, 203, 128),
+    (1080, 607, 256),
+    (97, 13, 32),
+    (50, 50, 75),
+])
+def test_square_block_index_matches_nearest_resize(width, height, res):
+    rng = np.random.default_rng(0)
+    pixels = rng.integers(0, 256, size=(height, width, 4), dtype=np.uint8)
+    img = Image.fromarray(pixels)
+
+    expected = img.resize((res, res), Image.Resampling.NEAREST).resize((width, height), Image.Resampling.NEAREST)
+    _, rows, cols = block_index(width, height, res, 'square')
+
+    assert np.array_equal(pixels[rows, cols], np.asarray(expected))
@@ -0,0 +1,46 @@
+import random
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("PIL.Image")
+pytest.importorskip("numpy")
+pytest.importorskip("PyQt5.QtWidgets")
+
+from yomi_gui import MemoryBudgetScheduler
+
+
+class RecordingWork:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = []
+        self.snapshots = []
+        self.calls = []
+
+    def __call__(self, job_id, estimate):
+        with self.lock:
+            self.running.append(estimate)
+            self.snapshots.append(list(self.running))
+            self.calls.append(job_id)
+        time.sleep(0.001)
+        with self.lock:
+            self.running.remove(estimate)
+        return job_id
+
+
+@pytest.mark.parametrize("max_workers, max_pending", [(1, 1), (4, 8), (8, 32)])
+def test_scheduler_respects_memory_budget(max_workers, max_pending):
+    budget = 100
+    rng = random.Random(0)
+    estimates = [rng.choice([1, 5, 20, 40, 60, 100, 150]) for _ in range(200)]
+    jobs = [(estimate, (job_id, estimate)) for job_id, estimate in enumerate(estimates)]
+    work = RecordingWork()
+
+    results = list(MemoryBudgetScheduler(max_workers, budget, max_pending).run(jobs, work))
+
+    assert sorted(results) == list(range(len(jobs)))
+    assert sorted(work.calls) == list(range(len(jobs)))
+    for running in work.snapshots:
+        assert len(running) <= max_workers
+        assert sum(running) <= budget or len(running) == 1
@@ -3,47 +3,254 @@ from PyQt5.QtWidgets import (QApplication, QWidget, QPushButton, QVBoxLayout,
                              QHBoxLayout, QLabel, QFileDialog, QSizePolicy, QScrollArea, 
                              QFrame, QStackedWidget, QGridLayout, QMessageBox, QCheckBox,
                              QLineEdit, QRadioButton, QButtonGroup, QGroupBox, QComboBox, 
-                             QProgressBar)
+                             QProgressBar, QSpinBox)
 from PyQt5.QtGui import QPixmap, QDragEnterEvent, QDropEvent
 from PyQt5.QtCore import Qt, QThread, pyqtSignal
 from PIL import Image, ImageOps
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+import bisect
+import functools
+import io
+import itertools
+import math
+import ntpath
 import os
+import posixpath
+import tarfile
+import time
+import zipfile
+import numpy as np
 
-def pixelate_image_logic(image_path, output_dir, resolutions, color_filter=None, output_format='png'):
-    processed_images = []
-    
+DEFAULT_MEMORY_BUDGET = 2048 * 1024 * 1024
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp')
+ARCHIVE_EXTENSIONS = ('.zip', '.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tbz2', '.tar.xz', '.txz')
+TAR_WRITE_MODES = {
+    '.tar.gz': 'w:gz', '.tgz': 'w:gz',
+    '.tar.bz2': 'w:bz2', '.tbz2': 'w:bz2',
+    '.tar.xz': 'w:xz', '.txz': 'w:xz',
+}
+
+def is_archive(path):
+    return path.lower().endswith(ARCHIVE_EXTENSIONS)
+
+def is_image(path):
+    return path.lower().endswith(IMAGE_EXTENSIONS)
+
+def is_same_path(path, other_path):
+    if os.path.exists(path) and os.path.exists(other_path):
+        return os.path.samefile(path, other_path)
+    return os.path.normcase(os.path.abspath(path)) == os.path.normcase(os.path.abspath(other_path))
+
+def archive_member_name(name):
+    if ntpath.splitdrive(name)[0] or ':' in name:
+        return None
+    name = posixpath.normpath(name.replace('\\', '/')).lstrip('/')
+    if name in ('', '.') or name == '..' or name.startswith('../'):
+        return None
+    return name
+
+def read_archive_member(read, name):
+    try:
+        return io.BytesIO(read())
+    except Exception as e:
+        print(f"An error occurred while reading {name}: {e}")
+        return None
+
+def iter_archive_images(archive_path):
+    try:
+        if archive_path.lower().endswith('.zip'):
+            with zipfile.ZipFile(archive_path) as archive:
+                for info in archive.infolist():
+                    name = archive_member_name(info.filename)
+                    if info.is_dir() or not name or not is_image(name):
+                        continue
+                    yield name, read_archive_member(lambda: archive.read(info), name)
+        else:
+            with tarfile.open(archive_path) as archive:
+                for member in archive:
+                    name = archive_member_name(member.name)
+                    if not member.isfile() or not name or not is_image(name):
+                        continue
+                    yield name, read_archive_member(lambda: archive.extractfile(member).read(), name)
+    except Exception as e:
+        print(f"An error occurred while reading {archive_path}: {e}")
+
+def archive_stem(archive_path):
+    name = os.path.basename(archive_path)
+    for ext in ARCHIVE_EXTENSIONS:
+        if name.lower().endswith(ext):
+            return name[:-len(ext)]
+    return name
+
+def unique_name(name, used_names):
+    base, ext = posixpath.splitext(name)
+    candidate = name
+    index = 2
+    while posixpath.splitext(candidate)[0].lower() in used_names:
+        candidate = f"{base}_{index}{ext}"
+        index += 1
+    used_names.add(posixpath.splitext(candidate)[0].lower())
+    return candidate
+
+def is_counted_upfront(path):
+    return not is_archive(path) or path.lower().endswith('.zip')
+
+def iter_source_images(paths):
+    used_names = set()
+    for path in paths:
+        if is_archive(path):
+            stem = archive_stem(path)
+            for name, source in iter_archive_images(path):
+                if source is None:
+                    yield name, None, path
+                else:
+                    yield unique_name(f"{stem}/{name}", used_names), source, path
+        else:
+            yield unique_name(os.path.basename(path), used_names), path, path
+
+def count_source_images(paths):
+    total = 0
+    for path in paths:
+        if not is_archive(path):
+            total += 1
+        elif is_counted_upfront(path):
+            try:
+                with zipfile.ZipFile(path) as archive:
+                    total += sum(1 for info in archive.infolist()
+                                 if not info.is_dir() and archive_member_name(info.filename) and is_image(info.filename))
+            except Exception as e:
+                print(f"An error occurred while reading {path}: {e}")
+    return total
+
+class ArchiveWriter:
+    def __init__(self, archive_path):
+        self.archive_path = archive_path
+        archive_dir = os.path.dirname(archive_path)
+        if archive_dir:
+            os.makedirs(archive_dir, exist_ok=True)
+
+        lower_path = archive_path.lower()
+        if lower_path.endswith('.zip'):
+            self.archive = zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_STORED)
+        else:
+            mode = next((mode for ext, mode in TAR_WRITE_MODES.items() if lower_path.endswith(ext)), 'w')
+            self.archive = tarfile.open(archive_path, mode)
+
+    def add(self, name, data):
+        if isinstance(self.archive, zipfile.ZipFile):
+            self.archive.writestr(name, data)
+        else:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mtime = int(time.time())
+            self.archive.addfile(info, io.BytesIO(data))
+
+    def close(self):
+        self.archive.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+GRID_MODE_RESOLUTIONS = {
+    'square': [32, 64, 128, 256, 512, 1024],
+    'long_edge': [32, 64, 128, 256, 512, 1024],
+    'block': [2, 4, 8, 16, 32, 64],
+}
+
+def resolution_label(res, grid_mode='square'):
+    if grid_mode == 'block':
+        return f"{res} px"
+    if grid_mode == 'long_edge':
+        return f"{res}"
+    return f"{res}x{res}"
+
+def grid_size(width, height, res, grid_mode='square'):
+    if isinstance(res, tuple):
+        return res
+    if grid_mode == 'block':
+        return math.ceil(width / res), math.ceil(height / res)
+    if grid_mode == 'long_edge':
+        long_edge = max(width, height)
+        return max(1, round(width * res / long_edge)), max(1, round(height * res / long_edge))
+    return res, res
+
+def nearest_index(length_in, length_out):
+    # Same sequential float stepping as Pillow's NEAREST scale, so square grids
+    # stay pixel-identical to resize((res, res)).resize((w, h)).
+    step = length_in / length_out
+    coords = itertools.accumulate(itertools.repeat(step, length_out - 1), initial=step * 0.5)
+    return np.minimum(np.fromiter(coords, dtype=np.float64, count=length_out).astype(np.intp), length_in - 1)
+
+def axis_index(length, cells, block_size=None):
+    if block_size:
+        block_of = np.arange(length) // block_size
+        centers = np.minimum(np.arange(cells) * block_size + block_size // 2, length - 1)
+    else:
+        block_of = nearest_index(cells, length)
+        centers = nearest_index(length, cells)
+    return centers[block_of]
+
+@functools.lru_cache(maxsize=64)
+def block_index(width, height, res, grid_mode='square'):
+    grid_width, grid_height = grid_size(width, height, res, grid_mode)
+    block_size = res if grid_mode == 'block' and not isinstance(res, tuple) else None
+    rows = axis_index(height, grid_height, block_size)[:, None]
+    cols = axis_index(width, grid_width, block_size)
+    rows.setflags(write=False)
+    cols.setflags(write=False)
+    return (grid_width, grid_height), rows, cols
+
+def render_pixelated_images(source, name, resolutions, color_filter=None, output_format='png', grid_mode='square'):
     if not resolutions:
         resolutions = [32, 64, 128, 256] 
+
+    img = Image.open(source).convert('RGBA')
+    
+    if color_filter == 'grayscale':
+        img = img.convert('L').convert('RGB')
+    elif color_filter == 'sepia':
+        img = ImageOps.colorize(img.convert('L'), '#704214', '#ffffff')
+
+    base_name = os.path.splitext(name)[0]
+    original_width, original_height = img.size
+    pixels = np.asarray(img)
+    rendered_grids = set()
         
-    try:
-        img = Image.open(image_path).convert('RGBA')
+    for res in resolutions:
+        (grid_width, grid_height), rows, cols = block_index(original_width, original_height, res, grid_mode)
+        if (grid_width, grid_height) in rendered_grids:
+            continue
+        rendered_grids.add((grid_width, grid_height))
+        pixelated_img = Image.fromarray(pixels[rows, cols])
+        
+        output_file_name = f"{base_name}_pixelated_{grid_width}x{grid_height}"
+        if color_filter:
+            output_file_name += f"_{color_filter}"
+        
+        if output_format == 'gif':
+            pixelated_img = pixelated_img.convert('P', palette=Image.Palette.ADAPTIVE)
         
-        if color_filter == 'grayscale':
-            img = img.convert('L').convert('RGB')
-        elif color_filter == 'sepia':
-            img = ImageOps.colorize(img.convert('L'), '#704214', '#ffffff')
+        yield f"{output_file_name}.{output_format}", pixelated_img
 
-        base_name = os.path.splitext(os.path.basename(image_path))[0]
-        original_width, original_height = img.size
+def pixelate_image_logic(image_path, output_dir, resolutions, color_filter=None, output_format='png', name=None, grid_mode='square'):
+    processed_images = []
+    
+    if name is None:
+        name = os.path.basename(image_path)
         
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
-            
-        for res in resolutions:
-            small_img = img.resize((res, res), resample=Image.Resampling.NEAREST)
-            pixelated_img = small_img.resize((original_width, original_height), resample=Image.Resampling.NEAREST)
-            
-            output_file_name = f"{base_name}_pixelated_{res}x{res}"
-            if color_filter:
-                output_file_name += f"_{color_filter}"
-            
-            output_file = os.path.join(output_dir, f"{output_file_name}.{output_format}")
-            
-            save_options = {}
-            if output_format == 'gif':
-                pixelated_img = pixelated_img.convert('P', palette=Image.Palette.ADAPTIVE)
+    try:
+        for output_name, pixelated_img in render_pixelated_images(image_path, name, resolutions, color_filter, output_format, grid_mode):
+            output_file = os.path.join(output_dir, output_name)
+            output_root = os.path.abspath(output_dir)
+            if os.path.commonpath([output_root, os.path.abspath(output_file)]) != output_root:
+                raise ValueError(f"Output path escapes the output folder: {output_name}")
+            os.makedirs(os.path.dirname(output_file) or '.', exist_ok=True)
             
-            pixelated_img.save(output_file, **save_options)
+            pixelated_img.save(output_file)
             processed_images.append(output_file)
             
     except Exception as e:
@@ -52,26 +259,166 @@ def pixelate_image_logic(image_path, output_dir, resolutions, color_filter=None,
     
     return processed_images
 
+def pixelate_image_to_bytes(source, name, resolutions, color_filter=None, output_format='png', grid_mode='square'):
+    encoded_images = []
+    try:
+        for output_name, pixelated_img in render_pixelated_images(source, name, resolutions, color_filter, output_format, grid_mode):
+            buffer = io.BytesIO()
+            pixelated_img.save(buffer, format=output_format.upper())
+            encoded_images.append((output_name, buffer.getvalue()))
+            
+    except Exception as e:
+        print(f"An error occurred: {e}")
+        return []
+    
+    return encoded_images
+
+def mode_bytes_per_pixel(mode):
+    if mode in ('1', 'L', 'P'):
+        return 1
+    if mode.startswith('I;16'):
+        return 2
+    return 4
+
+def estimate_peak_memory(source, color_filter=None, output_format='png', to_bytes=False):
+    try:
+        with Image.open(source) as img:
+            width, height = img.size
+            mode = img.mode
+    except Exception:
+        return 0
+    finally:
+        if hasattr(source, 'seek'):
+            source.seek(0)
+
+    # Bytes per source pixel held at once by render_pixelated_images; Pillow
+    # stores RGB/RGBA images at 4 bytes per pixel and L/P at 1.
+    decoded = mode_bytes_per_pixel(mode)
+    rgba_convert = 4
+    filter_copies = 1 + 4 if color_filter else 0  # 'L' then 'RGB'
+    array_copy = 4
+    gather_output = 4
+    fromarray_copy = 4
+    gif_palette = 1 if output_format == 'gif' else 0
+    encode_buffer = 4 if to_bytes else 0  # worst case: incompressible output
+
+    bytes_per_pixel = (decoded + rgba_convert + filter_copies + array_copy + gather_output
+                       + fromarray_copy + gif_palette + encode_buffer)
+    return width * height * bytes_per_pixel
+
+class MemoryBudgetScheduler:
+    def __init__(self, max_workers, memory_budget, max_pending=None):
+        self.max_workers = max(1, max_workers)
+        self.memory_budget = memory_budget
+        self.max_pending = max(self.max_workers, max_pending or 0)
+
+    def pick(self, pending, available, idle):
+        index = bisect.bisect_right(pending, available, key=lambda job: job[0])
+        if index:
+            return index - 1
+        if idle:
+            return len(pending) - 1
+        return None
+
+    def run(self, jobs, func):
+        jobs = iter(jobs)
+        exhausted = False
+        pending = []
+        running = {}
+        in_use = 0
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while True:
+                while not exhausted and len(pending) + len(running) < self.max_pending:
+                    try:
+                        job = next(jobs)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    bisect.insort(pending, job, key=lambda job: job[0])
+                    
+                while pending and len(running) < self.max_workers:
+                    index = self.pick(pending, self.memory_budget - in_use, not running)
+                    if index is None:
+                        break
+                    estimate, args = pending.pop(index)
+                    running[executor.submit(func, *args)] = estimate
+                    in_use += estimate
+                    
+                if not running:
+                    break
+                    
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    in_use -= running.pop(future)
+                    yield future.result()
+
 class PixelationThread(QThread):
     finished = pyqtSignal(list)
     progress_updated = pyqtSignal(int)
     
-    def __init__(self, image_paths, output_dir, resolutions, color_filter, output_format):
+    def __init__(self, image_paths, output_dir, resolutions, color_filter, output_format, max_in_flight=None, memory_budget=None, grid_mode='square'):
         super().__init__()
         self.image_paths = image_paths
         self.output_dir = output_dir
         self.resolutions = resolutions
         self.color_filter = color_filter
         self.output_format = output_format
+        self.max_in_flight = max(1, max_in_flight or (os.cpu_count() or 1) * 4)
+        self.memory_budget = memory_budget or DEFAULT_MEMORY_BUDGET
+        self.max_workers = min(os.cpu_count() or 1, self.max_in_flight)
+        self.grid_mode = grid_mode
+
+    def process(self, name, source):
+        if self.archive_writer:
+            return pixelate_image_to_bytes(source, name, self.resolutions, self.color_filter, self.output_format, self.grid_mode)
+        return pixelate_image_logic(source, self.output_dir, self.resolutions, self.color_filter, self.output_format, name=name, grid_mode=self.grid_mode)
+
+    def jobs(self):
+        for name, source, path in iter_source_images(self.image_paths):
+            if source is None:
+                if is_counted_upfront(path):
+                    self.total_images -= 1
+                    self.emit_progress()
+                continue
+            if not is_counted_upfront(path):
+                self.total_images += 1
+            estimate = estimate_peak_memory(source, self.color_filter, self.output_format,
+                                            to_bytes=bool(self.archive_writer))
+            yield estimate, (name, source)
+
+    def collect(self, result, all_processed_files):
+        if self.archive_writer:
+            for output_name, data in result:
+                self.archive_writer.add(output_name, data)
+                all_processed_files.append(f"{self.output_dir}/{output_name}")
+        else:
+            all_processed_files.extend(result)
+        self.completed_images += 1
+        self.emit_progress()
+
+    def emit_progress(self):
+        if self.total_images:
+            self.progress_updated.emit(int((self.completed_images / self.total_images) * 100))
 
     def run(self):
         all_processed_files = []
-        total_images = len(self.image_paths)
-        for i, path in enumerate(self.image_paths):
-            processed_files = pixelate_image_logic(path, self.output_dir, self.resolutions, self.color_filter, self.output_format)
-            all_processed_files.extend(processed_files)
-            progress = int(((i + 1) / total_images) * 100)
-            self.progress_updated.emit(progress)
+        self.completed_images = 0
+        self.archive_writer = None
+        try:
+            self.total_images = count_source_images(self.image_paths)
+            if is_archive(self.output_dir):
+                self.archive_writer = ArchiveWriter(self.output_dir)
+            
+            scheduler = MemoryBudgetScheduler(self.max_workers, self.memory_budget, self.max_in_flight)
+            for result in scheduler.run(self.jobs(), self.process):
+                self.collect(result, all_processed_files)
+                
+        except Exception as e:
+            print(f"An error occurred: {e}")
+        finally:
+            if self.archive_writer:
+                self.archive_writer.close()
             
         self.finished.emit(all_processed_files)
 
@@ -148,12 +495,14 @@ class MainPage(QWidget):
         res_layout = QGridLayout()
 
         self.resolution_checkboxes = []
-        resolutions = [32, 64, 128, 256, 512, 1024]
+        self.grid_mode = 'square'
+        self.checked_by_grid_mode = {}
         col = 0
         row = 0
-        for res in resolutions:
-            cb = QCheckBox(f"{res}x{res}")
+        for res in GRID_MODE_RESOLUTIONS[self.grid_mode]:
+            cb = QCheckBox(resolution_label(res, self.grid_mode))
             cb.setObjectName("optionCheckBox")
+            cb.setProperty('resolution', res)
             cb.setChecked(True)
             self.resolution_checkboxes.append(cb)
             res_layout.addWidget(cb, row, col)
@@ -166,10 +515,21 @@ class MainPage(QWidget):
         res_layout.addWidget(custom_res_label, row + 1, 0, 1, 1)
         
         self.custom_res_input = QLineEdit()
-        self.custom_res_input.setPlaceholderText("e.g. 75")
+        self.custom_res_input.setPlaceholderText("e.g. 75 or 160x90")
         self.custom_res_input.setObjectName("customResInput")
         res_layout.addWidget(self.custom_res_input, row + 1, 1, 1, 2)
         
+        grid_mode_label = QLabel("Grid Mode:")
+        res_layout.addWidget(grid_mode_label, row + 2, 0, 1, 1)
+        
+        self.grid_mode_combo = QComboBox()
+        self.grid_mode_combo.addItem("Square", 'square')
+        self.grid_mode_combo.addItem("Long Edge Cells", 'long_edge')
+        self.grid_mode_combo.addItem("Block Size (px)", 'block')
+        self.grid_mode_combo.setObjectName("formatComboBox")
+        self.grid_mode_combo.currentIndexChanged.connect(self.update_grid_mode)
+        res_layout.addWidget(self.grid_mode_combo, row + 2, 1, 1, 2)
+        
         res_groupbox.setLayout(res_layout)
         left_panel.addWidget(res_groupbox)
 
@@ -180,7 +540,7 @@ class MainPage(QWidget):
         output_dir_layout = QHBoxLayout()
         self.output_dir_label = QLabel("Output Folder:")
         self.output_dir_line = QLineEdit("pixelated_images")
-        self.output_dir_line.setPlaceholderText("pixelated_images")
+        self.output_dir_line.setPlaceholderText("pixelated_images or pixelated_images.zip")
         self.output_dir_line.setObjectName("customResInput")
         self.output_dir_button = QPushButton("Browse...")
         self.output_dir_button.clicked.connect(self.select_output_directory)
@@ -198,6 +558,26 @@ class MainPage(QWidget):
         format_layout.addWidget(self.format_combo)
         save_layout.addLayout(format_layout)
         
+        in_flight_layout = QHBoxLayout()
+        in_flight_label = QLabel("Images in Flight:")
+        self.in_flight_spin = QSpinBox()
+        self.in_flight_spin.setRange(1, 256)
+        self.in_flight_spin.setValue((os.cpu_count() or 1) * 4)
+        self.in_flight_spin.setObjectName("settingsSpinBox")
+        in_flight_layout.addWidget(in_flight_label)
+        in_flight_layout.addWidget(self.in_flight_spin)
+        save_layout.addLayout(in_flight_layout)
+        
+        memory_layout = QHBoxLayout()
+        memory_label = QLabel("Memory Budget (MB):")
+        self.memory_spin = QSpinBox()
+        self.memory_spin.setRange(64, 1024 * 1024)
+        self.memory_spin.setValue(DEFAULT_MEMORY_BUDGET // (1024 * 1024))
+        self.memory_spin.setObjectName("settingsSpinBox")
+        memory_layout.addWidget(memory_label)
+        memory_layout.addWidget(self.memory_spin)
+        save_layout.addLayout(memory_layout)
+        
         save_groupbox.setLayout(save_layout)
         left_panel.addWidget(save_groupbox)
 
@@ -242,6 +622,17 @@ class MainPage(QWidget):
 
         main_layout.addLayout(right_panel, 2)
 
+    def update_grid_mode(self):
+        self.checked_by_grid_mode[self.grid_mode] = [cb.isChecked() for cb in self.resolution_checkboxes]
+        self.grid_mode = self.grid_mode_combo.currentData()
+        
+        resolutions = GRID_MODE_RESOLUTIONS[self.grid_mode]
+        checked = self.checked_by_grid_mode.get(self.grid_mode, [True] * len(resolutions))
+        for cb, res, is_checked in zip(self.resolution_checkboxes, resolutions, checked):
+            cb.setText(resolution_label(res, self.grid_mode))
+            cb.setProperty('resolution', res)
+            cb.setChecked(is_checked)
+
     def select_output_directory(self):
         options = QFileDialog.Options()
         directory = QFileDialog.getExistingDirectory(self, "Select Output Folder", "", options=options)
@@ -250,7 +641,7 @@ class MainPage(QWidget):
 
     def openFileNamesDialog(self):
         options = QFileDialog.Options()
-        file_names, _ = QFileDialog.getOpenFileNames(self, "Select Images", "", "Images (*.png *.jpg *.jpeg *.bmp)", options=options)
+        file_names, _ = QFileDialog.getOpenFileNames(self, "Select Images", "", "Images (*.png *.jpg *.jpeg *.bmp);;Archives (*.zip *.tar *.tar.gz *.tgz *.tar.bz2 *.tbz2 *.tar.xz *.txz)", options=options)
         if file_names:
             self.set_images(file_names)
 
@@ -276,7 +667,9 @@ class MainPage(QWidget):
             preview_layout.setAlignment(Qt.AlignLeft)
             
             for path in self.image_paths:
-                if os.path.exists(path):
+                if is_archive(path):
+                    preview_layout.addWidget(QLabel(os.path.basename(path)))
+                elif os.path.exists(path):
                     pixmap = QPixmap(path)
                     label = QLabel()
                     label.setPixmap(pixmap.scaled(150, 150, Qt.KeepAspectRatio, Qt.SmoothTransformation))
@@ -300,8 +693,12 @@ class MainPage(QWidget):
                 self.original_image_label.hide()
                 self.original_image_label = new_label
                 
-            pixmap = QPixmap(self.image_paths[0])
-            self.original_image_label.setPixmap(pixmap)
+            if is_archive(self.image_paths[0]):
+                self.original_image_label.setPixmap(QPixmap())
+                self.original_image_label.setText(os.path.basename(self.image_paths[0]))
+            else:
+                pixmap = QPixmap(self.image_paths[0])
+                self.original_image_label.setPixmap(pixmap)
 
     def dragEnterEvent(self, event: QDragEnterEvent):
         if event.mimeData().hasUrls():
@@ -324,7 +721,7 @@ class MainPage(QWidget):
         for url in urls:
             if url.isLocalFile():
                 file_path = url.toLocalFile()
-                if file_path.lower().endswith(('.png', '.jpg', '.jpeg', '.bmp')):
+                if is_image(file_path) or is_archive(file_path):
                     file_paths.append(file_path)
         if file_paths:
             self.set_images(file_paths)
@@ -340,17 +737,21 @@ class MainPage(QWidget):
             selected_resolutions = []
             for cb in self.resolution_checkboxes:
                 if cb.isChecked():
-                    res = int(cb.text().split('x')[0])
-                    selected_resolutions.append(res)
+                    selected_resolutions.append(cb.property('resolution'))
             
             custom_res_text = self.custom_res_input.text().strip()
             if custom_res_text:
                 try:
-                    custom_res = int(custom_res_text)
-                    if custom_res > 0:
-                        selected_resolutions.append(custom_res)
+                    if 'x' in custom_res_text.lower():
+                        custom_width, custom_height = (int(part) for part in custom_res_text.lower().split('x'))
+                        if custom_width > 0 and custom_height > 0:
+                            selected_resolutions.append((custom_width, custom_height))
+                    else:
+                        custom_res = int(custom_res_text)
+                        if custom_res > 0:
+                            selected_resolutions.append(custom_res)
                 except ValueError:
-                    QMessageBox.warning(self, "Invalid Input", "Please enter a valid number for custom resolution.")
+                    QMessageBox.warning(self, "Invalid Input", "Please enter a valid number or WxH size for custom resolution.")
                     self.pixelate_button.setEnabled(True)
                     self.pixelate_button.setText("Pixelate")
                     return
@@ -360,6 +761,12 @@ class MainPage(QWidget):
                 self.pixelate_button.setEnabled(True)
                 self.pixelate_button.setText("Pixelate")
                 return
+            
+            if is_archive(output_folder) and any(is_same_path(output_folder, path) for path in self.image_paths):
+                QMessageBox.warning(self, "Invalid Output", "The output archive cannot be one of the input archives.")
+                self.pixelate_button.setEnabled(True)
+                self.pixelate_button.setText("Pixelate")
+                return
 
             color_filter = None
             if self.grayscale_radio.isChecked():
@@ -369,7 +776,11 @@ class MainPage(QWidget):
                 
             output_format = self.format_combo.currentText().lower()
 
-            self.pixelation_thread = PixelationThread(self.image_paths, output_folder, selected_resolutions, color_filter, output_format)
+            max_in_flight = self.in_flight_spin.value()
+            memory_budget = self.memory_spin.value() * 1024 * 1024
+            grid_mode = self.grid_mode_combo.currentData()
+
+            self.pixelation_thread = PixelationThread(self.image_paths, output_folder, selected_resolutions, color_filter, output_format, max_in_flight, memory_budget, grid_mode)
             self.pixelation_thread.progress_updated.connect(self.progress_bar.setValue)
             self.pixelation_thread.finished.connect(self.display_results)
             self.pixelation_thread.start()
@@ -393,9 +804,10 @@ class MainPage(QWidget):
             res_label.setObjectName("resultResolutionLabel")
             
             image_label = QLabel()
-            pixmap = QPixmap(file_path)
-            scaled_pixmap = pixmap.scaled(200, 200, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            image_label.setPixmap(scaled_pixmap)
+            if os.path.isfile(file_path):
+                pixmap = QPixmap(file_path)
+                scaled_pixmap = pixmap.scaled(200, 200, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                image_label.setPixmap(scaled_pixmap)
             image_label.setAlignment(Qt.AlignCenter)
             
             result_row.addWidget(res_label)
@@ -663,7 +1075,7 @@ class YomiApp(QWidget):
                 background-color: #55b8e9;
                 border-radius: 6px;
             }
-            #formatComboBox {
+            #formatComboBox, #settingsSpinBox {
                 background-color: #3b4556;
                 color: #e6e8eb;
                 border: 1px solid #4a5468;